@@ -61,6 +61,17 @@ else:
         nodejs = None
 
 
+if TYPE_CHECKING:
+    import orjson as _orjson
+
+    orjson = make_optional(_orjson)
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+
 def removeprefix(string: str, prefix: str) -> str:
     if string.startswith(prefix):
         return string[len(prefix) :]
@@ -7,6 +7,7 @@ from typing import (
     overload,
 )
 
+from . import _compat
 from ._types import BaseModelT
 
 
@@ -102,17 +103,17 @@ def _deserialize_prisma_object(
     model: type[BaseModelT] | None = None,
 ) -> BaseModelT | dict[str, Any]:
     # create a local reference to avoid performance penalty of global
-    # lookups on some python versions
-    _deserializers = DESERIALIZERS
+    # lookups on some python versions, we also resolve the deserializer
+    # with a single `.get()` call instead of a membership test + lookup
+    get_deserializer = DESERIALIZERS.get
 
     new_obj = {}
     for key, raw_value in raw_obj.items():
         value = raw_value['prisma__value']
-        prisma_type = raw_value['prisma__type']
-
+        deserializer = get_deserializer(raw_value['prisma__type'])
         new_obj[key] = (
-            _deserializers[prisma_type](value, for_model)
-            if prisma_type in _deserializers
+            deserializer(value, for_model)
+            if deserializer is not None
             else value
         )
 
@@ -133,18 +134,16 @@ def _deserialize_decimal(value: str, _for_model: bool) -> float:
 def _deserialize_array(value: list[Any], for_model: bool) -> list[Any]:
     # create a local reference to avoid performance penalty of global
     # lookups on some python versions
-    _deserializers = DESERIALIZERS
+    get_deserializer = DESERIALIZERS.get
 
     arr = []
     for entry in value:
-        prisma_type = entry['prisma__type']
         prisma_value = entry['prisma__value']
+        deserializer = get_deserializer(entry['prisma__type'])
         arr.append(
-            (
-                _deserializers[prisma_type](prisma_value, for_model)
-                if prisma_type in _deserializers
-                else prisma_value
-            )
+            deserializer(prisma_value, for_model)
+            if deserializer is not None
+            else prisma_value
         )
 
     return arr
@@ -158,12 +157,26 @@ def _deserialize_json(value: object, for_model: bool) -> object:
         # Pydantic expects Json fields to be a `str`, we should implement
         # an actual workaround for this validation instead of wasting compute
         # on re-serializing the data.
-        return json.dumps(value)
+        return _json_dumps(value)
 
     # This may or may not have already been deserialized by the database
     return value
 
 
+def _json_dumps(value: object) -> str:
+    # orjson is significantly faster than the standard library for large
+    # payloads but it is an optional dependency and it also cannot serialize
+    # some values, e.g. integers that do not fit into 64 bits
+    orjson = _compat.orjson
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(value)
+
+
 DESERIALIZERS: dict[str, Callable[[Any, bool], object]] = {
     'bigint': _deserialize_bigint,
     'decimal': _deserialize_decimal,
@@ -74,6 +74,11 @@ def ensure_cached() -> CLICache:
     cache_dir = config.binary_cache_dir
     entrypoint = cache_dir / 'node_modules' / 'prisma' / 'build' / 'index.js'
 
+    # the CLI has already been installed, this is by far the most common case
+    # so we avoid touching the filesystem any more than we have to
+    if entrypoint.exists():
+        return CLICache(cache_dir=cache_dir, entrypoint=entrypoint)
+
     if not cache_dir.exists():
         cache_dir.mkdir(parents=True)
 
@@ -86,32 +91,31 @@ def ensure_cached() -> CLICache:
     if not package.exists():
         package.write_text(json.dumps(DEFAULT_PACKAGE_JSON))
 
-    if not entrypoint.exists():
-        click.echo('Installing Prisma CLI')
-
-        try:
-            proc = npm.run(
-                'install',
-                f'prisma@{config.prisma_version}',
-                cwd=config.binary_cache_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
+    click.echo('Installing Prisma CLI')
+
+    try:
+        proc = npm.run(
+            'install',
+            f'prisma@{config.prisma_version}',
+            cwd=config.binary_cache_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        if proc.returncode != 0:
+            click.echo(
+                f'An error ocurred while installing the Prisma CLI; npm install log: {proc.stdout.decode("utf-8")}'
             )
-            if proc.returncode != 0:
-                click.echo(
-                    f'An error ocurred while installing the Prisma CLI; npm install log: {proc.stdout.decode("utf-8")}'
-                )
-                proc.check_returncode()
-        except Exception:
-            # as we use the entrypoint existing to check whether or not we should run `npm install`
-            # we need to make sure it doesn't exist if running `npm install` fails as it will otherwise
-            # lead to a broken state, https://github.com/RobertCraigie/prisma-client-py/issues/705
-            if entrypoint.exists():
-                try:
-                    entrypoint.unlink()
-                except Exception:
-                    pass
-            raise
+            proc.check_returncode()
+    except Exception:
+        # as we use the entrypoint existing to check whether or not we should run `npm install`
+        # we need to make sure it doesn't exist if running `npm install` fails as it will otherwise
+        # lead to a broken state, https://github.com/RobertCraigie/prisma-client-py/issues/705
+        if entrypoint.exists():
+            try:
+                entrypoint.unlink()
+            except Exception:
+                pass
+        raise
 
     if not entrypoint.exists():
         raise PrismaError(
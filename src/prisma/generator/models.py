@@ -244,7 +244,13 @@ class Module(BaseModel):
 
     @validator('spec', pre=True, allow_reuse=True)
     @classmethod
-    def spec_validator(cls, value: Optional[str]) -> machinery.ModuleSpec:
+    def spec_validator(
+        cls, value: Union[str, machinery.ModuleSpec, None]
+    ) -> machinery.ModuleSpec:
+        # support re-validating an already constructed model, e.g. `Module.parse_obj(module.dict())`
+        if isinstance(value, machinery.ModuleSpec):
+            return value
+
         spec: Optional[machinery.ModuleSpec] = None
 
         # TODO: this should really work based off of the schema path
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from pytest_mock import MockerFixture
+
 from prisma.cli import prisma
 from prisma._config import Config
 
@@ -19,3 +21,24 @@ def test_package_json_in_parent_dir(tmp_path: Path) -> None:
         )
     ):
         assert prisma.run(['-v']) == 0
+
+
+def test_ensure_cached_existing_entrypoint(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    """npm is not invoked when the CLI entrypoint has already been installed"""
+    entrypoint = tmp_path / 'node_modules' / 'prisma' / 'build' / 'index.js'
+    entrypoint.parent.mkdir(parents=True)
+    entrypoint.write_text('')
+
+    npm = mocker.patch.object(prisma, 'npm')
+
+    with set_config(
+        Config.parse(
+            binary_cache_dir=tmp_path,
+        )
+    ):
+        cache = prisma.ensure_cached()
+
+    npm.run.assert_not_called()
+    assert cache == prisma.CLICache(cache_dir=tmp_path, entrypoint=entrypoint)
@@ -11,6 +11,7 @@ def test_module_serialization() -> None:
         'scripts/partial_type_generator.py'
     )
     module = Module.parse_obj({'spec': str(path)})
+    assert Module.parse_obj(module.dict()).spec.name == module.spec.name
     assert Module.parse_raw(module.json()).spec.name == module.spec.name
 
 
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel, Json
+from pytest_mock import MockerFixture
+
+from prisma import _compat
+from prisma._raw_query import deserialize_raw_results
+
+
+class Model(BaseModel):
+    data: Json[Any]
+
+
+def _raw_json(value: object) -> List[Dict[str, Any]]:
+    return [{'data': {'prisma__type': 'json', 'prisma__value': value}}]
+
+
+@pytest.mark.skipif(_compat.orjson is None, reason='orjson is not installed')
+def test_json_orjson(mocker: MockerFixture) -> None:
+    """Json fields are re-serialized with orjson when it is installed"""
+    assert _compat.orjson is not None
+    spy = mocker.spy(_compat.orjson, 'dumps')
+
+    value = {'foo': [1, 2.5, 'bar'], 'baz': {'is_foo': True}}
+    models = deserialize_raw_results(_raw_json(value), model=Model)
+    assert models[0].data == value
+    assert spy.call_count == 1
+
+
+@pytest.mark.skipif(_compat.orjson is None, reason='orjson is not installed')
+def test_json_orjson_large_int_fallback() -> None:
+    """Integers that orjson cannot serialize fall back to the standard library"""
+    models = deserialize_raw_results(_raw_json({'x': 2**70}), model=Model)
+    assert models[0].data == {'x': 2**70}
+
+
+def test_json_without_orjson(mocker: MockerFixture) -> None:
+    """Json fields are re-serialized with the standard library when orjson is not installed"""
+    mocker.patch.object(_compat, 'orjson', None)
+
+    value = {'foo': [1, 2.5, 'bar'], 'x': 2**70, 'empty': None}
+    models = deserialize_raw_results(_raw_json(value), model=Model)
+    assert models[0].data == value
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_json_none(mocker: MockerFixture, use_orjson: bool) -> None:
+    """None values are preserved regardless of whether or not orjson is installed"""
+    if not use_orjson:
+        mocker.patch.object(_compat, 'orjson', None)
+    elif _compat.orjson is None:
+        pytest.skip('orjson is not installed')
+
+    value = {'empty': None, 'nested': [None, {'nullable': None}]}
+    models = deserialize_raw_results(_raw_json(value), model=Model)
+    assert models[0].data == value